@@ -153,6 +153,7 @@ main() {
     shiv \
         --site-packages "$TEMP_BUILD_DIR" \
         --compressed \
+        --compile-pyc \
         --entry-point "$ENTRY_POINT" \
         --output-file "$DIST_DIR/$SCRIPT_NAME" \
         --python "/usr/bin/env python3" \
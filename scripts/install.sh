@@ -103,8 +103,12 @@ install_binary() {
     if [ -f "dist/dip" ]; then
         # Local installation (building from source)
         log_info "Installing from local build"
-        cp "dist/dip" "${BIN_DIR}/dip"
-        chmod +x "${BIN_DIR}/dip"
+        # Copy next to the target, then rename over it in one step
+        trap 'rm -f "${BIN_DIR}/dip.new"' EXIT
+        cp "dist/dip" "${BIN_DIR}/dip.new"
+        chmod +x "${BIN_DIR}/dip.new"
+        mv -f "${BIN_DIR}/dip.new" "${BIN_DIR}/dip"
+        trap - EXIT
     else
         # Download from GitHub releases
         log_info "Downloading from GitHub releases"
@@ -124,7 +128,10 @@ install_binary() {
 
         log_info "Downloading: $DOWNLOAD_URL"
 
-        TEMP_FILE=$(mktemp)
+        # Same filesystem as the target, so the final 'mv' is an atomic rename
+        TEMP_FILE=$(mktemp "${BIN_DIR}/.dip.XXXXXX")
+        # Removed if the download or chmod fails ('set -e' exits right away)
+        trap 'rm -f "$TEMP_FILE"' EXIT
         if command -v curl &> /dev/null; then
             curl -fsSL "$DOWNLOAD_URL" -o "$TEMP_FILE"
         elif command -v wget &> /dev/null; then
@@ -134,8 +141,9 @@ install_binary() {
             exit 1
         fi
 
-        mv "$TEMP_FILE" "${BIN_DIR}/dip"
-        chmod +x "${BIN_DIR}/dip"
+        chmod +x "$TEMP_FILE"
+        mv -f "$TEMP_FILE" "${BIN_DIR}/dip"
+        trap - EXIT
     fi
 
     log_info "Binary installed ✓"
@@ -43,55 +43,56 @@ __email__ = "opensource@banesbyte.com"
 ##
 # Imports
 ##
-import argparse
 import sys
-from pathlib import Path
-
-from dip.config import config
-from dip.output import Output
-from dip.manager import CliManager
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import List, Optional
 
 ##
 # Arguments parser
+#
+# Every registrar attaches its command handler with set_defaults(handler=...),
+# main() then calls args.handler(args, dip).
 ##
-def create_parser() -> argparse.ArgumentParser:
-  """Create argument parser"""
-  parser = argparse.ArgumentParser(
-    prog='dip',
-    description='Docker Integration Platform - Simplify Docker workflows',
-    formatter_class=argparse.RawDescriptionHelpFormatter
-  )
-
-  parser.add_argument('--version', action='version', version=f'dip {__version__}')
-  parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose output for debugging')
-  parser.add_argument('--no-color', action='store_true', help='Disable colored output')
-
-  subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-  # Traefik commands
+def _add_traefik(subparsers):
   traefik_parser = subparsers.add_parser('traefik', help='Manage Traefik proxy')
   traefik_parser.add_argument('action', choices=['start', 'stop', 'status', 'restart', 'reset'])
+  traefik_parser.set_defaults(handler=lambda args, dip: dip.traefik(args.action))
 
+
+def _add_traefik_label(subparsers):
   traefik_generate_parser = subparsers.add_parser('traefik-label', help='Generate docker-compose config for traefik')
   traefik_generate_parser.add_argument('service', help='Service name')
   traefik_generate_parser.add_argument('host', help='Host name')
   traefik_generate_parser.add_argument('--port', help='Port (default: 80)', dest='port', default='80')
+  traefik_generate_parser.set_defaults(
+    handler=lambda args, dip: dip.traefik_config(args.service, args.host, args.port)
+  )
 
-  # Shell command (with backward-compatible bash alias)
-  shell_parser = subparsers.add_parser('shell', aliases=['sh'], help='Enter shell in a container')
+
+def _add_shell(subparsers):
+  # Shell command ('bash' is rewritten to 'shell --type bash' in main)
+  shell_parser = subparsers.add_parser(
+    'shell', aliases=['sh'],
+    help="Enter shell in a container ('dip bash <service>' is short for --type bash)",
+    description="Enter shell in a container. 'dip bash <service>' is short for 'dip shell --type bash <service>'."
+  )
   shell_parser.add_argument('service', help='Service name')
   shell_parser.add_argument('--type', '-t', dest='shell_type',
                             choices=['bash', 'sh', 'zsh', 'fish'],
                             default='bash',
                             help='Shell type to use (default: bash)')
-  # Backward compatibility: 'bash' command as alias
-  bash_parser = subparsers.add_parser('bash', help='Enter bash shell (alias for: shell --type bash)')
-  bash_parser.add_argument('service', help='Service name')
+  shell_parser.set_defaults(handler=lambda args, dip: dip.shell(args.service, args.shell_type))
 
+
+def _add_run(subparsers):
   run_parser = subparsers.add_parser('run', help='Run a custom command')
-  run_parser.add_argument('cmd', nargs=argparse.REMAINDER, help='Script filename')
+  # Filled by main() from the tokens after 'run', argparse never parses them
+  run_parser.add_argument('cmd', nargs='*', metavar='command', help='Script filename and its arguments')
+  run_parser.set_defaults(handler=lambda args, dip: dip.exec_custom(args.cmd[0], args.cmd[1:]))
+
 
-  # Exec command
+def _add_exec(subparsers):
   exec_parser = subparsers.add_parser('exec', help='Execute a command in a container')
   exec_parser.add_argument('service', help='Service name')
   exec_parser.add_argument('cmd', nargs='+', help='Command to execute')
@@ -99,51 +100,137 @@ def create_parser() -> argparse.ArgumentParser:
                            choices=['bash', 'sh', 'zsh', 'fish'],
                            default='bash',
                            help='Shell to use for command execution (default: bash)')
+  exec_parser.set_defaults(handler=lambda args, dip: dip.exec(args.service, args.cmd, args.shell_type))
+
 
+def _add_mkcert(subparsers):
   mkcert_parser = subparsers.add_parser('mkcert', help='Generate self-signed certificate for local development and configure Traefik')
   mkcert_parser.add_argument('domain', help='Domain name (e.g., *.locallan, app.local, *.dev)')
+  mkcert_parser.add_argument('--country', help='Country Name, 2 letter code (default: US)')
+  mkcert_parser.add_argument('--state', help='State or Province Name (default: NC)')
+  mkcert_parser.add_argument('--locality', help='Locality Name, e.g. city (default: Wilmington)')
+  mkcert_parser.set_defaults(
+    handler=lambda args, dip: dip.mkcert(args.domain, args.country, args.state, args.locality)
+  )
+
+
+def _add_db(subparsers):
+  from pathlib import Path
 
-  # DB commands
   db_parser = subparsers.add_parser('db', help='Database operations')
+  # Without an action only the 'db' help is shown
+  db_parser.set_defaults(handler=lambda args, dip: db_parser.parse_args(['-h']))
   db_subparsers = db_parser.add_subparsers(dest='db_action')
 
   dump_parser = db_subparsers.add_parser('dump', help='Export database dump')
   dump_parser.add_argument('output_path', type=Path, help='Output file path')
+  dump_parser.set_defaults(handler=lambda args, dip: dip.db_dump(args.output_path))
 
   import_parser = db_subparsers.add_parser('import', help='Import database dump')
   import_parser.add_argument('input_path', type=Path, help='Input file path')
+  import_parser.set_defaults(handler=lambda args, dip: dip.db_import(args.input_path))
 
-  # Container management
-  subparsers.add_parser('start', help='Start all containers')
-  subparsers.add_parser('stop', help='Stop all containers')
-  subparsers.add_parser('restart', help='Restart all containers')
-  subparsers.add_parser('status', help='Show container status')
 
-  logs_parser = subparsers.add_parser('logs', help='View container logs')
-  logs_parser.add_argument('service', nargs='?', help='Service name (optional)')
+def _add_service_command(name: str, help: str, handler):
+  """Registrar for a command with an optional service argument"""
+  def add(subparsers):
+    command_parser = subparsers.add_parser(name, help=help)
+    command_parser.add_argument('service', nargs='?', help='Service name (optional)')
+    command_parser.set_defaults(handler=handler)
+  return add
 
-  build_parser = subparsers.add_parser('build', help='Rebuild service containers')
-  build_parser.add_argument('service', nargs='?', help='Service name (optional)')
 
-  subparsers.add_parser('pull', help='Pull latest images')
-  subparsers.add_parser('reset', help='Reset containers (stop, remove, start)')
-  subparsers.add_parser('remove', help='Removes project containers')
+def _add_command(name: str, help: str, handler):
+  """Registrar for a command without arguments"""
+  def add(subparsers):
+    subparsers.add_parser(name, help=help).set_defaults(handler=handler)
+  # Lets main() run a bare `dip <name>` without argparse
+  add.handler = handler
+  return add
 
-  # Monitoring
-  subparsers.add_parser('sysinfo', help='Show system information')
-  subparsers.add_parser('cleanup', help='Remove unused containers/images')
-  subparsers.add_parser('prune', help='Remove all unused Docker resources')
 
-  stats_parser = subparsers.add_parser('stats', help='Show container resource usage')
-  stats_parser.add_argument('service', nargs='?', help='Service name (optional)')
+# Command name (including aliases) -> subparser registrar, in help order
+COMMANDS = {
+  # Traefik commands
+  'traefik':       _add_traefik,
+  'traefik-label': _add_traefik_label,
 
-  top_parser = subparsers.add_parser('top', help='Show running processes')
-  top_parser.add_argument('service', nargs='?', help='Service name (optional)')
+  # Commands execution
+  'shell':         _add_shell,
+  'sh':            _add_shell,
+  'run':           _add_run,
+  'exec':          _add_exec,
+  'mkcert':        _add_mkcert,
 
-  subparsers.add_parser('health', help='Check services health')
+  # DB commands
+  'db':            _add_db,
+
+  # Container management
+  'start':         _add_command('start', 'Start all containers', lambda args, dip: dip.start()),
+  'stop':          _add_command('stop', 'Stop all containers', lambda args, dip: dip.stop()),
+  'restart':       _add_command('restart', 'Restart all containers', lambda args, dip: dip.restart()),
+  'status':        _add_command('status', 'Show container status', lambda args, dip: dip.status()),
+  'logs':          _add_service_command('logs', 'View container logs', lambda args, dip: dip.logs(args.service)),
+  'build':         _add_service_command('build', 'Rebuild service containers', lambda args, dip: dip.build(args.service)),
+  'pull':          _add_command('pull', 'Pull latest images', lambda args, dip: dip.pull()),
+  'reset':         _add_command('reset', 'Reset containers (stop, remove, start)', lambda args, dip: dip.reset()),
+  'remove':        _add_command('remove', 'Removes project containers', lambda args, dip: dip.remove()),
+
+  # Monitoring
+  'sysinfo':       _add_command('sysinfo', 'Show system information', lambda args, dip: dip.sysinfo()),
+  'cleanup':       _add_command('cleanup', 'Remove unused containers/images', lambda args, dip: dip.cleanup()),
+  'prune':         _add_command('prune', 'Remove all unused Docker resources', lambda args, dip: dip.prune()),
+  'stats':         _add_service_command('stats', 'Show container resource usage', lambda args, dip: dip.stats(args.service)),
+  'top':           _add_service_command('top', 'Show running processes', lambda args, dip: dip.top(args.service)),
+  'health':        _add_command('health', 'Check services health', lambda args, dip: dip.health()),
 
   # Update
-  subparsers.add_parser('update', help="Update 'dip' script to the latest version")
+  'update':        _add_command('update', "Update 'dip' script to the latest version", lambda args, dip: dip.update()),
+}
+
+
+def find_command(argv: List[str]) -> Optional[str]:
+  """Return the command name from the command line, if any"""
+  for arg in argv:
+    if not arg.startswith('-'):
+      return arg
+    if arg in ('-h', '--help'):
+      return None
+  return None
+
+
+def create_parser(argv: Optional[List[str]] = None) -> 'argparse.ArgumentParser':
+  """Create argument parser
+
+  Only the subparser of the requested command is built; the full command set
+  is registered for help output and unknown commands.
+  """
+  command = find_command(sys.argv[1:] if argv is None else argv)
+  return _build_parser(command if command in COMMANDS else None)
+
+
+@lru_cache(maxsize=None)
+def _build_parser(command: Optional[str]) -> 'argparse.ArgumentParser':
+  """Build (once per command) the parser with one or all subparsers"""
+  import argparse
+
+  parser = argparse.ArgumentParser(
+    prog='dip',
+    description='Docker Integration Platform - Simplify Docker workflows',
+    formatter_class=argparse.RawDescriptionHelpFormatter
+  )
+
+  parser.add_argument('--version', action='version', version=f'dip {__version__}')
+  parser.add_argument('-v', '--verbose', action='store_true', help='Enable verbose output for debugging')
+  parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+
+  subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+  if command:
+    COMMANDS[command](subparsers)
+  else:
+    for add in dict.fromkeys(COMMANDS.values()):
+      add(subparsers)
 
   return parser
 
@@ -153,113 +240,78 @@ def create_parser() -> argparse.ArgumentParser:
 ##
 def main():
   """Main entry point"""
-  parser = create_parser()
-  args = parser.parse_args()
-
-  # Display help if no arguments provided
-  if not args.command:
-    parser.print_help()
-    sys.exit(1)
-
-  Output(args.verbose, args.no_color)
+  sys.excepthook = custom_excepthook
+  argv = sys.argv[1:]
+
+  # Same output as argparse's 'version' action, without building the parser
+  if argv[:1] == ['--version']:
+    print(f'dip {__version__}')
+    return
+
+  command = find_command(argv)
+
+  # A bare command without arguments skips importing and running argparse
+  handler = getattr(COMMANDS.get(command), 'handler', None) if len(argv) == 1 else None
+  if handler:
+    args = SimpleNamespace(command=command, verbose=False, no_color=False, handler=handler)
+  else:
+    args = parse_args(argv, command)
+
+  # Deferred until a command is about to run, so help/usage never loads them
+  from dip.output import get_output
+  from dip.manager import CliManager
+
+  # Default flags need no setup, the first get_output() call creates the instance
+  if args.verbose or args.no_color:
+    get_output(args.verbose, args.no_color)
   dip = CliManager(__version__, args.verbose)
 
   if args.verbose:
     dip.output.debug("Verbose mode enabled")
 
-  ##
-  # Commands dont require project
-  ##
-  if args.command == 'sysinfo':
-    dip.sysinfo()
-
-  # Self-update process
-  elif args.command == 'update':
-    dip.update()
-
-  elif args.command == 'prune':
-    dip.prune()
-
-  elif args.command == 'run':
-    dip.exec_custom(args.cmd[0], args.cmd[1:])
-
-  ##
-  # Traefik management
-  ##
-  elif args.command == 'traefik':
-    dip.traefik(args.action)
-  elif args.command == 'traefik-label':
-    dip.traefik_config(args.service, args.host, args.port)
-  elif args.command == 'mkcert':
-    dip.mkcert(args.domain)
-
-  ##
-  # Commands' execution
-  ##
-  elif args.command == 'shell':
-      dip.shell(args.service, args.shell_type)
-  elif args.command == 'bash':
-      dip.shell(args.service)
-  elif args.command == 'exec':
-      dip.exec(args.service, args.cmd, args.shell_type)
-
-  ##
-  # Container management
-  ##
-  elif args.command == 'start':
-    dip.start()
-  elif args.command == 'stop':
-    dip.stop()
-  elif args.command == 'restart':
-    dip.restart()
-  elif args.command == 'build':
-    dip.build(args.service)
-  elif args.command == 'pull':
-    dip.pull()
-  elif args.command == 'reset':
-    dip.reset()
-  elif args.command == 'remove':
-    dip.remove()
-  elif args.command == 'cleanup':
-    dip.cleanup()
-
-  ##
-  # Container information
-  ##
-  elif args.command == 'status':
-    dip.status()
-  elif args.command == 'logs':
-    dip.logs(args.service)
-  elif args.command == 'stats':
-    dip.stats(args.service if hasattr(args, 'service') else None)
-  elif args.command == 'top':
-    dip.top(args.service)
-  elif args.command == 'health':
-    dip.health()
-
-  ##
-  # Database management
-  ##
-  elif args.command == 'db':
-    if args.db_action == 'dump':
-      dip.db_dump(args.output_path)
-    elif args.db_action == 'import':
-      dip.db_import(args.input_path)
-    else:
-      parser.parse_args(['db', '-h'])
+  args.handler(args, dip)
 # --------------------------------------
 
 
+def parse_args(argv: List[str], command: Optional[str]):
+  """Parse the command line with argparse, exits on help and usage errors"""
+  # Backward compatibility: 'bash' command as alias for 'shell --type bash'
+  if command == 'bash':
+    i = argv.index('bash')
+    argv[i:i + 1] = ['shell', '--type', 'bash']
+
+  # Everything after 'run' is passed to the custom command as is
+  run_args = []
+  if command == 'run':
+    i = argv.index('run') + 1
+    if argv[i:i + 1] not in (['-h'], ['--help']):
+      argv, run_args = argv[:i], argv[i:]
+
+  parser = create_parser(argv)
+  args = parser.parse_args(argv)
+
+  if command == 'run':
+    if not run_args:
+      parser.error("the following arguments are required: command")
+    args.cmd = run_args
+
+  # Display help if no arguments provided
+  if not args.command:
+    parser.print_help()
+    sys.exit(1)
+
+  return args
+
+
 def custom_excepthook(exc_type, exc_value, exc_traceback):
   if exc_type == KeyboardInterrupt:
-    print("\n\nInterrupted by user")
+    sys.stderr.write("\n\nInterrupted by user\n")
+    sys.stderr.flush()
     sys.exit(1)
 
   sys.__excepthook__(exc_type, exc_value, exc_traceback)
 
 
-sys.excepthook = custom_excepthook
-
 ##
 # Entry point
 ##
@@ -267,9 +319,9 @@ if __name__ == '__main__':
   try:
     main()
   except KeyboardInterrupt:
-    print("\nInterrupted by user")
+    sys.stderr.write("\nInterrupted by user\n")
     sys.exit(130)
   except Exception as e:
-    print(f"Error: {e}", file=sys.stderr)
+    sys.stderr.write(f"Error: {e}\n")
     sys.exit(1)
 
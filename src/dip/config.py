@@ -1,25 +1,42 @@
-from dataclasses import dataclass
+from types import MappingProxyType
 
-@dataclass
+##
+# Env var names passed to docker compose
+##
+ENV_PROJECT_NAME   = 'PROJECT_NAME'         #
+ENV_PROJECT_ROOT   = 'PROJECT_ROOT'         # Was: PROJECT_ROOT_DIR
+ENV_FILE           = 'ENV_FILE'             # Was: PROJECT_ENV_PATH
+ENV_DIP_DIR        = 'DIP_DIR'              # Was: PROJECT_DOCKER_DIR
+ENV_CONTAINER_ROOT = 'CONTAINER_ROOT'       # Was: CONTAINER_DIR
+ENV_HOST_UID       = 'HOST_UID'             #
+ENV_HOST_GID       = 'HOST_GID'             #
+ENV_COMPOSE_NAME   = 'COMPOSE_PROJECT_NAME' # DO NOT CHANGE! DOCKER-SYSTEM RESERVED ENV VARNAME
+
+
+# Plain class, `dataclasses` (and the `inspect` module it imports) would
+# only add import time for constants without instance state
 class Config:
+  __slots__ = ()
+
   bin_name = 'dip'
 
   container_root = '/var/www'
 
-  repo = {
+  repo = MappingProxyType({
     'owner': 'syntlyx',
     'name': 'dip-cli',
-  }
-
-  env_name = {
-    'project_name':   'PROJECT_NAME',         #
-    'project_root':   'PROJECT_ROOT',         # Was: PROJECT_ROOT_DIR
-    'env_file':       'ENV_FILE',             # Was: PROJECT_ENV_PATH
-    'dip_dir':        'DIP_DIR',              # Was: PROJECT_DOCKER_DIR
-    'container_root': 'CONTAINER_ROOT',       # Was: CONTAINER_DIR
-    'host_uid':       'HOST_UID',             #
-    'host_gid':       'HOST_GID',             #
-    'compose_name':   'COMPOSE_PROJECT_NAME', # DO NOT CHANGE! DOCKER-SYSTEM RESERVED ENV VARNAME
-  }
+  })
+
+  # Kept for compatibility, prefer the ENV_* constants
+  env_name = MappingProxyType({
+    'project_name':   ENV_PROJECT_NAME,
+    'project_root':   ENV_PROJECT_ROOT,
+    'env_file':       ENV_FILE,
+    'dip_dir':        ENV_DIP_DIR,
+    'container_root': ENV_CONTAINER_ROOT,
+    'host_uid':       ENV_HOST_UID,
+    'host_gid':       ENV_HOST_GID,
+    'compose_name':   ENV_COMPOSE_NAME,
+  })
 
 config = Config()
@@ -1,25 +1,95 @@
 
+import json
 import os
-import re
 import sys
 import urllib.request
+import shutil
 import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from subprocess import CompletedProcess
 from pathlib import Path
 from typing import Optional, List
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.tree import Tree
-from rich import box
-
 from dip.config import config
-from dip.output import Output
+from dip.output import get_output
 from dip.project import ProjectConfig, load_project
 
+# An absolute path, with close_fds=False, lets subprocess start docker with
+# posix_spawn() instead of fork() + exec(). Python's own fds are created
+# non-inheritable (PEP 446), so keeping fds open leaks none into docker.
+DOCKER_BIN = shutil.which("docker") or "docker"
+
+# Characters (including whitespace within one argument) that only a shell can interpret
+SHELL_CHARS = frozenset(';|&$<>*?`\'"()[]{}~#\\ \t\n')
+
+# Shell selection inside the container, part of the same `docker exec`:
+# `$0` is the requested shell, sh is used when it isn't installed
+ENTER_SHELL = 'command -v "$0" >/dev/null 2>&1 && exec "$0"; echo "$0 not found in container, trying sh..." >&2; exec sh'
+RUN_IN_SHELL = 'command -v "$0" >/dev/null 2>&1 && exec "$0" -c "$1"; exec sh -c "$1"'
+
+# External network shared by Traefik and project containers
+TRAEFIK_NETWORK = "traefik_proxy"
+
+# Dump file suffix -> command compressing stdin to stdout
+DUMP_COMPRESSORS = {
+  '.gz': ["gzip", "-1"],
+  '.zst': ["zstd", "-3", "-q"],
+}
+DUMP_DECOMPRESSORS = {
+  '.gz': ["gzip", "-dc"],
+  '.zst': ["zstd", "-dcq"],
+}
+DUMP_PIPE_SIZE = 1 << 20
+
+# Docker health state -> `dip health` column, anything else has no healthcheck
+HEALTH_DISPLAY = {
+  'healthy': "[green]✓ Healthy[/green]",
+  'unhealthy': "[red]✗ Unhealthy[/red]",
+  'starting': "[yellow]◌ Starting[/yellow]",
+}
+NO_HEALTH_DISPLAY = "[dim]- No check[/dim]"
+
+
+def needs_shell(command: List[str]) -> bool:
+  """Check if a command uses shell syntax (pipes, globs, variables, 'VAR=value cmd', ...)"""
+  return '=' in command[0] or any(c in SHELL_CHARS for arg in command for c in arg)
+
+
+def docker_api(path: str):
+  """GET a Docker Engine API path over the local unix socket
+
+  Returns the decoded JSON, or None when the socket can't be used (remote
+  DOCKER_HOST, non-default context, daemon down) and the CLI has to be used.
+  """
+  host = os.environ.get("DOCKER_HOST", "unix:///var/run/docker.sock")
+  if not host.startswith("unix://") or os.environ.get("DOCKER_CONTEXT"):
+    return None
+
+  try:
+    docker_config = Path(os.environ.get("DOCKER_CONFIG", Path.home() / ".docker")) / "config.json"
+    if json.loads(docker_config.read_text()).get("currentContext", "default") != "default":
+      return None
+  except (OSError, ValueError):
+    pass
+
+  import http.client
+  import socket
+
+  sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+  try:
+    sock.settimeout(5)
+    sock.connect(host[len("unix://"):])
+    connection = http.client.HTTPConnection("localhost")
+    connection.sock = sock
+    connection.request("GET", path)
+    response = connection.getresponse()
+    return json.loads(response.read()) if response.status == 200 else None
+  except (OSError, http.client.HTTPException, ValueError):
+    return None
+  finally:
+    sock.close()
+
 
 ##
 # Docker manager class
@@ -32,15 +102,22 @@ class CliManager:
 
     self.version = version
     self.verbose = verbose
-    self.output = Output()
-    self.is_docker = self.is_installed()
+    self.output = get_output()
     self.project: Optional[ProjectConfig] = None
+    # Service name -> container ID and the running containers listing,
+    # both reset by forget_containers() whenever containers are (re)created or stopped
+    self._container_ids: dict[str, str] = {}
+    self._running_containers: Optional[List[tuple[str, str]]] = None
+    self._daemon_running = False
+    self._project_searched = False
 
     self.dip_bin = home_dir / '.local/bin' / config.bin_name
     self.config_dir = Path(os.getenv('XDG_CONFIG_HOME', home_dir / '.config')) / config.bin_name
     self.data_dir = Path(os.getenv('XDG_DATA_HOME', home_dir / '.local/share')) / config.bin_name
     self.cache_dir = Path(os.getenv('XDG_CACHE_HOME', home_dir / '.cache')) / config.bin_name
     self.traefik_dir = self.config_dir / "traefik"
+    self.traefik_compose_file = self.traefik_dir / "docker-compose.yml"
+    self.traefik_compose_args = ("compose", "-f", str(self.traefik_compose_file))
 
     icon = f"[bold green]{self.output.icon('ok')}[/bold green]"
     self.output.verbose_panel(
@@ -51,6 +128,11 @@ class CliManager:
       title="[bold green]CLI Config[/bold green]",
     )
 
+  @cached_property
+  def is_docker(self) -> bool:
+    """Docker availability, probed on first access only"""
+    return self.is_installed()
+
   def is_installed(self) -> bool:
     try:
       self.compose(["version"], check=True, timeout=5)
@@ -59,32 +141,68 @@ class CliManager:
       return False
 
   def is_running(self):
-    """Check if the Docker daemon is running"""
+    """Check if the Docker daemon is running (probed once, then remembered)"""
+    if self._daemon_running:
+      return
+
+    # Answered over the Engine API socket when possible, no `docker info` process
+    if docker_api("/version") is not None:
+      self._daemon_running = True
+      return
+
     try:
       subprocess.run(
-        ["docker", "info"],
-        capture_output=True, check=True, timeout=5
+        [DOCKER_BIN, "info"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, timeout=5,
+        close_fds=False
       )
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
       self.output.error("Docker daemon is not running")
       sys.exit(1)
 
+    self._daemon_running = True
+
   def docker(self, args: list[str] = None,
              text: bool = True,
              capture_output: bool = True,
              check: bool = False,
-             timeout: Optional[int] = None) -> CompletedProcess:
+             timeout: Optional[int] = None,
+             stdout=None,
+             stderr=None) -> CompletedProcess:
+    # Explicit `stdout`/`stderr` (e.g. DEVNULL) replace `capture_output`
     self.is_running()
-    cmd = ["docker", *args]
-    self.output.debug(f"Running: {' '.join(cmd)}")
+    cmd = [DOCKER_BIN, *args]
+    if self.verbose:
+      self.output.debug(f"Running: {' '.join(cmd)}")
     return subprocess.run(
       cmd,
-      capture_output=capture_output,
+      capture_output=capture_output and stdout is None and stderr is None,
+      stdout=stdout,
+      stderr=stderr,
       timeout=timeout,
       check=check,
-      text=text
+      text=text,
+      close_fds=False
     )
 
+  def exec_docker(self, args: list[str]):
+    """Replace the dip process with an interactive docker command, never returns
+
+    The command's exit code becomes dip's exit code.
+    """
+    self.is_running()
+    cmd = [DOCKER_BIN, *args]
+    if self.verbose:
+      self.output.debug(f"Running: {' '.join(cmd)}")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(cmd[0], cmd)
+
+  @cached_property
+  def compose_prefix(self) -> tuple[str, ...]:
+    """`docker compose -f <project file>` argv, built once the project is loaded"""
+    return DOCKER_BIN, "compose", "-f", str(self.project.compose_file)
+
   def compose(self, args: list[str] = None,
               text: bool = True,
               capture_output: bool = True,
@@ -95,12 +213,9 @@ class CliManager:
     if not self.project:
       raise RuntimeError( "Runtime Error: Project is not initialized.")
 
-    cmd = [
-      "docker", "compose",
-      "-f", str(self.project.compose_file),
-      *args,
-    ]
-    self.output.debug(f"Running: {' '.join(cmd)}")
+    cmd = [*self.compose_prefix, *args]
+    if self.verbose:
+      self.output.debug(f"Running: {' '.join(cmd)}")
 
     return subprocess.run(
       cmd,
@@ -108,27 +223,33 @@ class CliManager:
       capture_output=capture_output,
       timeout=timeout,
       check=check,
-      text=text
+      text=text,
+      close_fds=False
     )
 
 
   def load_project(self, no_error: bool = False) -> bool:
-    if not self.project:
+    # Looked up once, a missing project is not searched for again
+    if not self.project and not self._project_searched:
       self.project = load_project()
+      self._project_searched = True
 
     if self.project:
       return True
 
     if no_error:
-      Output().warning(f"Not a dip project: '.dip' directory not found")
+      get_output().warning(f"Not a dip project: '.dip' directory not found")
       return False
 
-    Output().error(f"Not a dip project: '.dip' directory not found")
+    get_output().error(f"Not a dip project: '.dip' directory not found")
     sys.exit(1)
 
 
   def get_container_id(self, service: str, no_error: bool = False) -> Optional[str]:
     """Get container ID for a service"""
+    if service in self._container_ids:
+      return self._container_ids[service]
+
     self.is_running()
     self.load_project()
 
@@ -139,72 +260,169 @@ class CliManager:
       service
     ]
 
-    self.output.debug(f"Looking for container with name: {service}")
+    if self.verbose:
+      self.output.debug(f"Looking for container with name: {service}")
 
+    # Patterns in priority order against one listing, substring match like `--filter name=`
+    containers = self.running_containers()
     for pattern in patterns:
-      self.output.debug(f"Trying pattern: {pattern}")
-      result = self.docker(["ps", "-q", "--filter", f"name={pattern}"])
-      if result.stdout.strip():
-        container_id = result.stdout.strip().split()[0]
-        self.output.debug(f"Found container ID: {container_id}")
+      if self.verbose:
+        self.output.debug(f"Trying pattern: {pattern}")
+      container_id = next((cid for cid, cname in containers if pattern in cname), None)
+      if container_id:
+        if self.verbose:
+          self.output.debug(f"Found container ID: {container_id}")
+        self._container_ids[service] = container_id
         return container_id
 
     if not no_error:
       self.output.error(f"Container for service '{service}' not found")
       sys.exit(1)
 
-    self.output.debug(f"No container found for service: {service}")
+    if self.verbose:
+      self.output.debug(f"No container found for service: {service}")
     return None
 
+  def running_containers(self) -> List[tuple[str, str]]:
+    """(ID, name) of every running container, listed once per lookup cycle
+
+    Read from the Engine API socket when possible, otherwise with a single `docker ps`.
+    """
+    if self._running_containers is None:
+      containers = docker_api("/containers/json")
+      if containers is not None:
+        # Short IDs and names without the leading '/', same as `docker ps`
+        self._running_containers = [
+          (container["Id"][:12], container["Names"][0].lstrip('/')) for container in containers
+        ]
+      else:
+        result = self.docker(["ps", "--format", "{{.ID}}\t{{.Names}}"])
+        self._running_containers = [
+          tuple(line.split('\t', 1)) for line in result.stdout.splitlines() if '\t' in line
+        ]
+    return self._running_containers
+
+  def forget_containers(self):
+    """Drop cached container lookups, the next one queries docker again"""
+    self._container_ids.clear()
+    self._running_containers = None
+
+  def compose_ps(self, *args: str) -> List[dict]:
+    """List project containers as parsed `docker compose ps` JSON rows"""
+    # Raw bytes, json.loads() decodes them itself
+    result = self.compose(["ps", "--format", "json", *args], text=False, check=False)
+    if result.returncode != 0:
+      self.output.error(f"docker compose ps failed: {result.stderr.decode().strip()}")
+      return []
+
+    output = result.stdout.strip()
+    if not output:
+      return []
+
+    # Compose < 2.21 prints a single JSON array, newer versions one object per line,
+    # joined into an array so either way is a single json.loads() call
+    if not output.startswith(b'['):
+      output = b"[" + b",".join(line for line in output.splitlines() if line) + b"]"
+    return json.loads(output)
+
+  def docker_info(self) -> dict:
+    """Daemon `docker info` fields, from the Engine API socket or the CLI as JSON"""
+    info = docker_api("/info")
+    if info is None:
+      info = json.loads(self.docker(["info", "--format", "{{json .}}"], text=False).stdout)
+    return info
+
+  def docker_client_version(self) -> str:
+    """Docker CLI version from `docker --version`, which doesn't contact the daemon"""
+    # "Docker version 27.1.1, build 6312585"
+    output = self.docker(["--version"]).stdout.strip()
+    return output.split(' ')[2].rstrip(',') if output.startswith('Docker version ') else output
+
+  def compose_services(self) -> List[str]:
+    """Service names of the project compose file
+
+    Keys of the top-level 'services:' block are read from the file directly,
+    `docker compose config --services` is run when the file pulls in other
+    files ('include:', 'extends:'), gates services behind 'profiles:' (hidden
+    by compose unless enabled), uses an inline mapping or the scan finds no
+    services (quoted keys, flow style, anchors).
+    """
+    text = self.project.compose_file.read_text()
+    services, indent, in_services = [], None, False
+
+    if not any(key in text for key in ('include:', 'extends:', 'profiles:')):
+      for line in text.splitlines():
+        content = line.lstrip()
+        if not content or content[0] == '#':
+          continue
+
+        level = len(line) - len(content)
+        if level == 0:
+          key, _, rest = content.partition(':')
+          in_services = key == 'services'
+          if in_services and rest.split('#', 1)[0].strip():
+            break
+        elif in_services and level == (indent := indent or level):
+          services.append(content.partition(':')[0].strip('\'"'))
+      else:
+        if services:
+          return services
+
+    result = self.compose(["config", "--services"])
+    return [s for s in result.stdout.splitlines() if s]
+
   # --------------------------------------
   # Container Information
   # --------------------------------------
   def sysinfo(self):
     """Show Docker system information"""
-    self.is_running()
+    from rich.panel import Panel
+    from rich.tree import Tree
 
-    version_result = self.docker(
-      ["version", "--format", "Client: {{.Client.Version}}, Server: {{.Server.Version}}"],
-    )
-    info_result = self.docker(
-    ["info", "--format",
-      "{{.Containers}}\n{{.ContainersRunning}}\n{{.ContainersPaused}}\n"
-      "{{.ContainersStopped}}\n{{.Images}}"],
-    )
+    self.is_running()
+    has_project = self.load_project(True)
 
-    info = info_result.stdout.strip().split('\n')
+    # Service names are read in a worker while the daemon is queried
+    with ThreadPoolExecutor(max_workers=1) as pool:
+      services_future = pool.submit(self.compose_services) if has_project else None
+      info = self.docker_info()
 
+    # `docker info` JSON carries both versions, the API only the server one
+    client_version = info.get('ClientInfo', {}).get('Version') or self.docker_client_version()
 
     info_content = f"""[cyan]dip Version:[/cyan] {self.version}
-[cyan]Docker Version:[/cyan] {version_result.stdout.strip()}
-[cyan]Images:[/cyan] {info[4]}
+[cyan]Docker Version:[/cyan] Client: {client_version}, Server: {info['ServerVersion']}
+[cyan]Images:[/cyan] {info['Images']}
 [cyan]Containers:[/cyan]
-  Total: {info[0]}
-  Running: [green]{info[1]}[/green]
-  Paused: [yellow]{info[2]}[/yellow]
-  Stopped: [red]{info[3]}[/red]"""
+  Total: {info['Containers']}
+  Running: [green]{info['ContainersRunning']}[/green]
+  Paused: [yellow]{info['ContainersPaused']}[/yellow]
+  Stopped: [red]{info['ContainersStopped']}[/red]"""
 
     self.output.console.print(Panel(info_content, title="System Overview", border_style="bold blue", width=80))
 
-    if self.load_project(True):
+    if services_future:
       tree = Tree(f"[bold blue]◳ {self.project.project_name}[/bold blue]")
 
-      services_result = self.compose(["config", "--services"])
-
-      for service in sorted([s for s in services_result.stdout.strip().split('\n') if s.strip()]):
+      for service in sorted(services_future.result()):
         tree.add(f"[cyan]{service}[/cyan]")
 
       self.output.console.print(tree)
 
   def status(self):
     """Show container status"""
+    from rich.table import Table
+    from rich import box
+
     self.load_project()
     result = self.docker([
       "ps", "-a", "--filter", f"name={self.project.project_name}",
-       "--format", "{{.ID}}\t{{.Names}}\t{{.Status}}\t{{.Ports}}"
-    ])
+       "--format", "{{json .}}"
+    ], text=False)
 
-    if not result.stdout.strip():
+    # One JSON object per line, Ports may contain any separator
+    containers = [json.loads(line) for line in result.stdout.splitlines() if line]
+    if not containers:
       self.output.warning("No containers found")
       return
 
@@ -214,19 +432,16 @@ class CliManager:
     table.add_column("Status", style="magenta")
     table.add_column("Ports")
 
-    for line in result.stdout.strip().split('\n'):
-      parts = line.split('\t')
-      if len(parts) >= 2:
-        status = parts[2]
-        ports = parts[3] if len(parts) > 3 else ""
-        if "Up" in status:
-          status = f"[green]{status}[/green]"
-        elif "Exited" in status:
-          status = f"[red]{status}[/red]"
-        else:
-          status = f"[yellow]{status}[/yellow]"
+    for container in containers:
+      status = container["Status"]
+      if "Up" in status:
+        status = f"[green]{status}[/green]"
+      elif "Exited" in status:
+        status = f"[red]{status}[/red]"
+      else:
+        status = f"[yellow]{status}[/yellow]"
 
-        table.add_row(parts[0], parts[1], status, ports)
+      table.add_row(container["ID"], container["Names"], status, container.get("Ports", ""))
 
     self.output.console.print(table)
 
@@ -257,23 +472,28 @@ class CliManager:
     else:
       self.load_project()
       self.output.info(f"Running processes for {self.project.project_name} containers:")
-      result = self.docker(["ps", "-q", "--filter", f"name={self.project.project_name}"])
-      containers = result.stdout.strip().split()
+      containers = {container["ID"]: container["Name"] for container in self.compose_ps()}
       if not containers:
         self.output.warning("No running containers found")
         return
 
-      for container in containers:
-        name_result = self.docker(["ps", "--format", "{{.Names}}", "-f", f"id={container}"])
-        self.output.info(f"Container: {name_result.stdout.strip()}")
-        self.docker(["top", container], capture_output=False)
+      # One `docker top` per container, run concurrently and printed in order
+      with ThreadPoolExecutor(max_workers=min(16, len(containers))) as pool:
+        results = list(pool.map(lambda container_id: self.docker(["top", container_id]), containers))
+
+      for container_name, result in zip(containers.values(), results):
+        self.output.info(f"Container: {container_name}")
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
         self.output.info("-" * 47)
 
   def health(self):
     """Check services' health status"""
-    self.load_project()
-    result = self.docker(["ps", "-q", "--filter", f"name={self.project.project_name}"])
-    containers = result.stdout.strip().split()
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich import box
+
+    containers = self.compose_ps()
     if not containers:
       self.output.warning("No running containers found")
       return
@@ -286,40 +506,16 @@ class CliManager:
     all_healthy = True
 
     for container in containers:
-      name_result = self.docker(["ps", "--format", "{{.Names}}", "-f", f"id={container}"])
-      container_name = name_result.stdout.strip()
+      service_name = container["Service"]
+      status = container["State"]
+      health = container.get("Health", "")
 
-      match = re.search(rf"{self.project.project_name}[-_]([^-_]+)[-_]", container_name)
-      service_name = match.group(1) if match else container_name
+      running = status == "running"
+      status_display = "[green]● Running[/green]" if running else f"[red]● {status}[/red]"
+      health_display = HEALTH_DISPLAY.get(health, NO_HEALTH_DISPLAY)
 
-      health_result = self.docker([
-      "inspect", "--format",
-       "{{if .State.Health}}{{.State.Health.Status}}{{else}}No health check{{end}}",
-       container
-      ])
-      health = health_result.stdout.strip()
-
-      status_result = self.docker(["inspect", "--format", "{{.State.Status}}", container])
-      status = status_result.stdout.strip()
-
-      # Format status
-      if status == "running":
-        status_display = "[green]● Running[/green]"
-      else:
-        status_display = f"[red]● {status}[/red]"
-        all_healthy = False
-
-      # Format health
-      if health == "healthy":
-        health_display = "[green]✓ Healthy[/green]"
-      elif health == "unhealthy":
-        health_display = "[red]✗ Unhealthy[/red]"
-        all_healthy = False
-      elif health == "starting":
-        health_display = "[yellow]◌ Starting[/yellow]"
-        all_healthy = False
-      else:
-        health_display = "[dim]- No check[/dim]"
+      # Containers without a healthcheck count as healthy while running
+      all_healthy &= running and (health == "healthy" or health not in HEALTH_DISPLAY)
 
       table.add_row(service_name, status_display, health_display)
       # End FOR
@@ -345,23 +541,11 @@ class CliManager:
   # --------------------------------------
   # Commands execution
   # --------------------------------------
-  def is_shell_exists(self, container_id: str, shell_type: str) -> bool:
-    """Check if a shell exists in a container"""
-    result = self.docker(["exec", container_id, "which", shell_type])
-    return result.returncode == 0
-
   def shell(self, service: str, shell_type: str = "bash"):
     """Enter shell in a container"""
     container_id = self.get_container_id(service)
     self.output.verbose(f"Entering {shell_type} in container: {container_id}")
-    if not self.is_shell_exists(container_id, shell_type):
-      self.output.warning(f"{shell_type} not found in container, trying sh...")
-      shell_type = "sh"
-      if not self.is_shell_exists(container_id, shell_type):
-        self.output.error("No shell found in container")
-        sys.exit(1)
-
-    self.docker(["exec", "-it", container_id, shell_type], capture_output=False, text=False)
+    self.exec_docker(["exec", "-it", container_id, "sh", "-c", ENTER_SHELL, shell_type])
 
   def exec(self, service: str, command: tuple[str, ...], shell_type: str = "bash"):
     """Execute a command in a container."""
@@ -372,28 +556,25 @@ class CliManager:
     relative_path = cwd.relative_to(self.project.root_dir) if cwd.is_relative_to(self.project.root_dir) else Path()
     container_dest_path = Path(self.project.container_dir) / relative_path
 
-    self.output.debug(f"Working directory: {container_dest_path}")
-    self.output.debug(f"Command: {' '.join(command)}")
-    self.output.debug(f"Shell: {shell_type}")
+    if self.verbose:
+      self.output.debug(f"Working directory: {container_dest_path}")
+      self.output.debug(f"Command: {' '.join(command)}")
 
-    # Check if the specified shell exists
-    if not self.is_shell_exists(container_id, shell_type):
-      self.output.debug(f"{shell_type} not found, falling back to sh")
-      shell_type = "sh"
+    # Plain commands run as is, a shell is only started for shell syntax
+    if needs_shell(command):
+      if self.verbose:
+        self.output.debug(f"Shell: {shell_type}")
+      command = ["sh", "-c", RUN_IN_SHELL, shell_type, " ".join(command)]
 
-    result = self.docker([
+    self.exec_docker([
       "exec",
       "-e", "COLUMNS",
       "-e", "LINES",
       "-it",
       "-w", str(container_dest_path),
       container_id,
-      shell_type, "-ilc",
-      " ".join(command)
-    ], capture_output=False, text=False)
-    if result.returncode != 0:
-      self.output.error(f"Command exited with code: {result.returncode}")
-      sys.exit(result.returncode)
+      *command
+    ])
 
   def exec_custom(self, command: str, args: List[str]) -> bool:
     """Execute a custom project command if it exists"""
@@ -405,7 +586,8 @@ class CliManager:
     cmd_file = cmd_dir / command
     if cmd_file.exists() and os.access(cmd_file, os.X_OK):
       cmd = [str(cmd_file), *args]
-      self.output.debug(f"Executing custom command: {' '.join(cmd)}")
+      if self.verbose:
+        self.output.debug(f"Executing custom command: {' '.join(cmd)}")
       subprocess.run(cmd, env=self.project.get_env())
       return True
 
@@ -419,12 +601,14 @@ class CliManager:
     """Start all containers"""
     self.auto_start_traefik()
     self.output.info("Starting containers...")
+    self.forget_containers()
     self.compose(["up", "-d"], capture_output=False)
     self.output.success("All containers started successfully")
 
   def stop(self):
     """Stop all containers"""
     self.output.info("Stopping containers...")
+    self.forget_containers()
     self.compose(["stop"], capture_output=False)
     self.output.success("All containers stopped")
 
@@ -432,6 +616,7 @@ class CliManager:
     """start all containers"""
     self.auto_start_traefik()
     self.output.info("Restarting containers...")
+    self.forget_containers()
     self.compose(["restart"], capture_output=False)
     self.output.success("All containers restarted")
 
@@ -454,6 +639,7 @@ class CliManager:
 
   def reset(self):
     """Reset containers (stop, remove, start)"""
+    self.forget_containers()
     self.output.warning("Stopping containers...")
     self.compose(["stop"], capture_output=False)
     self.output.warning("Removing containers...")
@@ -465,6 +651,7 @@ class CliManager:
   def remove(self):
     """Reset containers (stop, remove, start)"""
     self.output.warning("Removing containers...")
+    self.forget_containers()
     self.compose(["rm", "-f"], capture_output=False)
     self.output.success("Containers removed")
 
@@ -472,17 +659,16 @@ class CliManager:
   def cleanup(self):
     """Remove unused containers/images for this project"""
     self.load_project()
-    self.output.warning("Finding stopped containers...")
+    self.output.warning("Removing stopped containers...")
+    # Listed and removed by the daemon in one call, scoped by the compose project label
     result = self.docker([
-      "ps", "-a", "-q",
-      "--filter", f"name={self.project.project_name}",
-      "--filter", "status=exited"
+      "container", "prune", "-f",
+      "--filter", f"label=com.docker.compose.project={self.project.compose_name}"
     ])
-
-    stopped = result.stdout.strip().split()
-    if stopped:
-      self.output.warning("Removing stopped containers...")
-      self.docker(["rm", *stopped], capture_output=False)
+    if result.returncode != 0:
+      self.output.error(f"docker container prune failed: {result.stderr.strip()}")
+    elif "Deleted Containers" in result.stdout:
+      self.output.console.print(result.stdout.strip())
     else:
       self.output.success("No stopped containers found")
 
@@ -493,6 +679,8 @@ class CliManager:
   # TODO: Needs testing
   def prune(self):
     """Remove all unused Docker resources"""
+    from rich.panel import Panel
+
     self.output.console.print(Panel(
       "This will remove:\n"
       "• All stopped containers\n"
@@ -530,18 +718,12 @@ class CliManager:
 
       self.output.info(f"Downloading update script from: {update_script_url}")
 
-      with tempfile.NamedTemporaryFile(mode='w', suffix='.sh', delete=False) as f:
-        update_script = f.name
-
-      urllib.request.urlretrieve(update_script_url, update_script)
-
-      os.chmod(update_script, 0o755)
+      # Kept in memory and passed to bash directly, no temp file to write and clean up
+      with urllib.request.urlopen(update_script_url, timeout=30) as response:
+        update_script = response.read().decode()
 
       self.output.warning("Running update...")
-      result = subprocess.run(["/bin/bash", update_script], check=False)
-
-      # Cleanup
-      os.remove(update_script)
+      result = subprocess.run(["/bin/bash", "-c", update_script, "update.sh"], check=False)
 
       if result.returncode == 0:
         self.output.success("Update complete!")
@@ -562,6 +744,8 @@ class CliManager:
   # TODO: Needs testing
   def db_dump(self, output_path: str):
     """Export database dump"""
+    import fcntl
+
     container_id = self.get_container_id("db")
 
     env_vars = self.project.get_env()
@@ -575,16 +759,37 @@ class CliManager:
     self.output.verbose(f"Database: {db_name}")
     self.output.verbose(f"Container: {container_id}")
 
+    # '.gz' and '.zst' dumps are compressed on the way to disk
+    compress_cmd = DUMP_COMPRESSORS.get(Path(output_path).suffix)
+    if compress_cmd:
+      # Checked before the output file is opened (and truncated)
+      if not shutil.which(compress_cmd[0]):
+        self.output.error(f"'{compress_cmd[0]}' not found, it is required to write {output_path}")
+        sys.exit(1)
+      self.output.verbose(f"Compression: {compress_cmd[0]}")
+
     with self.output.status(f"Exporting database '{db_name}' to {output_path}..."):
-      with open(output_path, 'w') as f:
+      with open(output_path, 'wb') as f:
+        compressor = subprocess.Popen(compress_cmd, stdin=subprocess.PIPE, stdout=f) if compress_cmd else None
+        if compressor and hasattr(fcntl, 'F_SETPIPE_SZ'):
+          # 1 MiB pipe instead of 64 KiB, fewer wakeups between the dump and the compressor
+          try:
+            fcntl.fcntl(compressor.stdin, fcntl.F_SETPIPE_SZ, DUMP_PIPE_SIZE)
+          except OSError:
+            pass
         result = subprocess.run(
-          ["docker", "exec", container_id, "mysqldump",
+          # Consistent InnoDB snapshot without table locks, rows streamed instead of buffered
+          [DOCKER_BIN, "exec", container_id, "mysqldump",
+           "--single-transaction", "--quick",
            "-uroot", f"-p{db_pass}", db_name],
-          stdout=f,
+          stdout=compressor.stdin if compressor else f,
           stderr=subprocess.PIPE
         )
+        if compressor:
+          compressor.stdin.close()
+          compressor.wait()
 
-      if result.returncode == 0:
+      if result.returncode == 0 and (not compressor or compressor.returncode == 0):
         self.output.success(f"Database exported successfully to {output_path}")
       else:
         self.output.error("Database export failed")
@@ -609,42 +814,32 @@ class CliManager:
     self.output.verbose(f"Database: {db_name}")
     self.output.verbose(f"Container: {container_id}")
     with self.output.status(f"Importing database from {input_path} to '{db_name}'..."):
-      # Copy file to container
-      self.output.verbose("Copying dump file to container...")
-      result = subprocess.run(
-        ["docker", "cp", input_path, f"{container_id}:/tmp/import.sql"],
-        capture_output=True
-      )
-
-      if result.returncode != 0:
-        self.output.error("Failed to copy dump file to container")
-        if self.verbose and result.stderr:
-          print(result.stderr.decode(), file=sys.stderr)
-        sys.exit(1)
-
-      # Import database
+      # Stream the dump into mysql over stdin, no copy inside the container
       self.output.verbose("Executing import...")
       import_cmd = (
-        f"mysql -uroot -p{db_pass} {db_name} "
-        "-e 'SET SESSION autocommit=0; SET SESSION unique_checks=0; "
-        "SET SESSION foreign_key_checks=0; SET SESSION sql_log_bin=0;' "
-        "-e 'SOURCE /tmp/import.sql;' "
-        "-e 'COMMIT;'"
-      )
-
-      result = subprocess.run(
-        ["docker", "exec", container_id, "sh", "-c", import_cmd],
-        capture_output=True
+        "{ echo 'SET SESSION autocommit=0; SET SESSION unique_checks=0; "
+        "SET SESSION foreign_key_checks=0; SET SESSION sql_log_bin=0;'; "
+        "cat; echo 'COMMIT;'; } "
+        f"| mysql -uroot -p{db_pass} {db_name}"
       )
 
-      # Cleanup
-      self.output.verbose("Cleaning up temporary file...")
-      subprocess.run(
-        ["docker", "exec", container_id, "rm", "-f", "/tmp/import.sql"],
-        capture_output=True
-      )
+      # '.gz' and '.zst' dumps are decompressed on the way in
+      decompress_cmd = DUMP_DECOMPRESSORS.get(Path(input_path).suffix)
+      if decompress_cmd and not shutil.which(decompress_cmd[0]):
+        self.output.error(f"'{decompress_cmd[0]}' not found, it is required to read {input_path}")
+        sys.exit(1)
+      with open(input_path, 'rb') as f:
+        decompressor = subprocess.Popen(decompress_cmd, stdin=f, stdout=subprocess.PIPE) if decompress_cmd else None
+        result = subprocess.run(
+          [DOCKER_BIN, "exec", "-i", container_id, "sh", "-c", import_cmd],
+          stdin=decompressor.stdout if decompressor else f,
+          capture_output=True
+        )
+        if decompressor:
+          decompressor.stdout.close()
+          decompressor.wait()
 
-      if result.returncode == 0:
+      if result.returncode == 0 and (not decompressor or decompressor.returncode == 0):
         self.output.success("Database imported successfully")
       else:
         self.output.error("Database import failed")
@@ -668,6 +863,9 @@ class CliManager:
         self.output.warning("Traefik is not running")
         return
 
+      from rich.table import Table
+      from rich import box
+
       result = self.docker([
         "ps", "--filter", "name=traefik",
          "--format", "{{.Names}}\t{{.Status}}\t{{.Ports}}"
@@ -678,7 +876,8 @@ class CliManager:
       table.add_column("Status", style="green")
       table.add_column("Ports", style="blue")
 
-      parts = result.stdout.strip().split('\t')
+      # First matching container only, at most one split per column
+      parts = result.stdout.partition('\n')[0].split('\t', 2)
       if len(parts) >= 2:
         table.add_row(parts[0], parts[1], parts[2] if len(parts) > 2 else "")
 
@@ -690,7 +889,7 @@ class CliManager:
 
     elif action == "reset":
       self.stop_traefik()
-      self.docker(["rm", "traefik"])
+      self.docker(["rm", "traefik"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
       self.start_traefik()
 
     else:
@@ -700,34 +899,35 @@ class CliManager:
 
   def is_traefik_running(self) -> bool:
     """Check if Traefik is running"""
-    result = self.docker(["ps", "--filter", "name=traefik", "--filter", "status=running", "-q"])
-    return bool(result.stdout.strip())
+    # Substring match, like `docker ps --filter name=traefik`
+    return any("traefik" in name for _, name in self.running_containers())
+
+  def has_traefik_network(self) -> bool:
+    """Check if the external Traefik network exists"""
+    return self.docker(['network', 'inspect', TRAEFIK_NETWORK],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
 
   # TODO: Improve error handling
   def check_traefik_network(self):
-    try:
-      self.docker(
-        ['network', 'inspect', "traefik_network"],
-        capture_output=True,
-        check=True
-      )
-    except subprocess.CalledProcessError:
-      self.docker(["network", "create", "traefik_proxy"])
+    """Create the Traefik network unless it exists"""
+    if not self.has_traefik_network():
+      self.docker(["network", "create", TRAEFIK_NETWORK], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
   def start_traefik(self):
     """Start Traefik proxy"""
     if self.is_traefik_running():
       return
 
-    compose_file: Path = self.traefik_dir / "docker-compose.yml"
-
-    if not compose_file.exists():
-      self.output.error(f"Traefik `docker-compose.yml` file not found: {compose_file}")
+    if not self.traefik_compose_file.exists():
+      self.output.error(f"Traefik `docker-compose.yml` file not found: {self.traefik_compose_file}")
       return
 
     with self.output.status("Starting Traefik proxy..."):
       self.check_traefik_network()
-      result = self.docker(["compose", "-f", str(compose_file), "up", "-d"])
+      # Only stderr is kept, for the failure message
+      result = self.docker([*self.traefik_compose_args, "up", "-d"],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+      self.forget_containers()
 
       if self.is_traefik_running():
         self.output.success("Traefik started successfully")
@@ -740,14 +940,14 @@ class CliManager:
       self.output.info("Traefik is not running")
       return
 
-    compose_file: Path = self.traefik_dir / "docker-compose.yml"
-
-    if not compose_file.exists():
-      self.output.error(f"Traefik `docker-compose.yml` file not found: {compose_file}")
+    if not self.traefik_compose_file.exists():
+      self.output.error(f"Traefik `docker-compose.yml` file not found: {self.traefik_compose_file}")
       return
 
     with self.output.status("Stopping Traefik proxy..."):
-      self.docker(["compose", "-f", str(compose_file), "down"])
+      self.docker([*self.traefik_compose_args, "down"],
+                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+      self.forget_containers()
 
     self.output.success("Traefik stopped")
 
@@ -778,7 +978,17 @@ class CliManager:
       f"  dip start"
     )
 
-  def mkcert(self, domain: str):
+  def openssl(self, args: list, error: str, input: str = None) -> CompletedProcess:
+    """Run openssl, exits with `error` and openssl's message on failure"""
+    result = subprocess.run(["openssl", *args], input=input, capture_output=True, text=True)
+    if result.returncode != 0:
+      self.output.error(f"{error}: {result.stderr.strip()}")
+      sys.exit(1)
+    return result
+
+  def mkcert(self, domain: str, country: str = None, state: str = None, locality: str = None):
+    from rich.panel import Panel
+
     self.output.info(f"Generating certificate for: [cyan]{domain}[/cyan]")
     domain_filename = domain.replace('*', 'wildcard').replace('.', '-')
     base_domain = domain.replace('*.', '') if '*' in domain else f"www.{domain}"
@@ -795,65 +1005,56 @@ class CliManager:
     chain_file: Path = certs_dir / f"{domain_filename}-chain.crt"  # NEW: Full chain
     config_file: Path = self.traefik_dir / "dynamic" / f"{domain_filename}.yml"
 
-    # Step 1: Create CA if it doesn't exist
+    # Step 1 & 2: The CA (if missing) and the server key are generated in the
+    # background, while the certificate subject is prompted for
+    ca_process = None
     if not ca_cert_file.exists():
       self.output.info(f"Generating Certificate Authority (CA)")
-
-      result = subprocess.run(
-        ["openssl", "genrsa", "-out", ca_key_file, "4096"],
-        capture_output=True
-      )
-      if result.returncode != 0:
-        self.output.error(f"Failed to generate CA key: {result.stderr.decode().strip()}")
-        sys.exit(1)
-      os.chmod(ca_key_file, 0o600)
-
-      result = subprocess.run(
-        ["openssl", "req", "-new", "-x509", "-days", "3650",
-         "-key", ca_key_file, "-out", ca_cert_file,
+      # Key and self-signed certificate from a single openssl process
+      ca_process = subprocess.Popen(
+        ["openssl", "req", "-x509", "-days", "3650",
+         "-newkey", "rsa:4096", "-nodes",
+         "-keyout", ca_key_file, "-out", ca_cert_file,
          "-subj", "/CN=Local Development CA/O=Development/OU=Certificate Authority"],
-        capture_output=True
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
       )
-      if result.returncode != 0:
-        self.output.error(f"Failed to generate CA certificate: {result.stderr.decode().strip()}")
-        sys.exit(1)
-
-      self.output.success(f"CA Certificate created: [default]{ca_cert_file}")
-      self.output.warning(f"Import {ca_cert_file} to your system's trusted root certificates!")
     else:
       self.output.info(f"Using existing CA: {ca_cert_file}")
 
-    # Step 2: Generate server private key
     self.output.info(f"Generating server private key")
-    result = subprocess.run(
+    key_process = subprocess.Popen(
       ["openssl", "genrsa", "-out", key_file, "2048"],
-      capture_output=True
+      stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
     )
-    if result.returncode != 0:
-      self.output.error(f"Failed to generate private key: {result.stderr.decode().strip()}")
+
+    # Step 3: Create CSR (Certificate Signing Request)
+    # Subject fields not given as options are asked for in a single prompt
+    if not (country and state and locality):
+      defaults = (country or "US", state or "NC", locality or "Wilmington")
+      response = input(f"Country/State/Locality [{'/'.join(defaults)}]: ")
+      entered = [field.strip() for field in response.split('/', 2)]
+      entered += [''] * (3 - len(entered))
+      country, state, locality = (field or default for field, default in zip(entered, defaults))
+
+    if ca_process:
+      _, stderr = ca_process.communicate()
+      if ca_process.returncode != 0:
+        self.output.error(f"Failed to generate CA certificate: {stderr.strip()}")
+        sys.exit(1)
+      os.chmod(ca_key_file, 0o600)
+
+      self.output.success(f"CA Certificate created: [default]{ca_cert_file}")
+      self.output.warning(f"Import {ca_cert_file} to your system's trusted root certificates!")
+
+    _, stderr = key_process.communicate()
+    if key_process.returncode != 0:
+      self.output.error(f"Failed to generate private key: {stderr.strip()}")
       sys.exit(1)
     os.chmod(key_file, 0o600)
     self.output.success(f"Private key: [default]{key_file}")
 
-    # Step 3: Create CSR (Certificate Signing Request)
-    country = "US"
-    state = "NC"
-    locality = "Wilmington"
-
-    response = input("Country Name (2 letter code) [US]: ")
-    if response:
-      country = response.strip()
-    response = input("State or Province Name (full name) [NC]: ")
-    if response:
-      state = response.strip()
-    response = input("Locality Name (eg, city) [Wilmington]: ")
-    if response:
-      locality = response.strip()
-
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.cnf') as f:
-      tmpcfg: Path = Path(f.name)
-
-    tmpcfg.write_text(f"""[req]
+    # openssl configs are piped through stdin, no temporary files
+    req_config = f"""[req]
 default_bits = 2048
 prompt = no
 default_md = sha256
@@ -866,25 +1067,17 @@ L={locality}
 O=Development
 OU=Local Development
 CN={domain}
-""")
+"""
 
     self.output.info(f"Generating Certificate Signing Request (CSR)")
-    result = subprocess.run(
-      ["openssl", "req", "-new", "-key", key_file,
-       "-out", csr_file, "-config", tmpcfg],
-      capture_output=True
+    self.openssl(
+      ["req", "-new", "-key", key_file, "-out", csr_file, "-config", "/dev/stdin"],
+      "Failed to generate CSR", input=req_config
     )
-    os.remove(tmpcfg)
-    if result.returncode != 0:
-      self.output.error(f"Failed to generate CSR: {result.stderr.decode().strip()}")
-      sys.exit(1)
-
 
-    # Step 4: Create extensions file for SAN
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.ext') as f:
-      tmpext: Path = Path(f.name)
 
-    tmpext.write_text(f"""basicConstraints = CA:FALSE
+    # Step 4: Create extensions config for SAN
+    ext_config = f"""basicConstraints = CA:FALSE
 keyUsage = critical, digitalSignature, keyEncipherment
 extendedKeyUsage = serverAuth
 subjectAltName = @alt_names
@@ -892,24 +1085,21 @@ subjectAltName = @alt_names
 [alt_names]
 DNS.1 = {domain}
 DNS.2 = {base_domain}
-""")
+"""
 
     # Step 5: Sign the certificate with CA
     self.output.info(f"Signing certificate with CA")
-    result = subprocess.run(
-    ["openssl", "x509", "-req", "-days", "365",
-     "-in", csr_file,
-     "-CA", ca_cert_file,
-     "-CAkey", ca_key_file,
-     "-CAcreateserial",
-     "-out", cert_file,
-     "-extfile", tmpext],
-      capture_output=True
+    self.openssl(
+      ["x509", "-req", "-days", "365",
+       "-in", csr_file,
+       "-CA", ca_cert_file,
+       "-CAkey", ca_key_file,
+       # Random serial, no shared ca-cert.srl file to create and update
+       "-set_serial", f"0x{os.urandom(16).hex()}",
+       "-out", cert_file,
+       "-extfile", "/dev/stdin"],
+      "Failed to sign certificate", input=ext_config
     )
-    os.remove(tmpext)
-    if result.returncode != 0:
-      self.output.error(f"Failed to sign certificate: {result.stderr.decode().strip()}")
-      sys.exit(1)
 
 
     # Clean up CSR (no longer needed)
@@ -920,11 +1110,7 @@ DNS.2 = {base_domain}
 
     # Step 6: Create full chain certificate (server cert + CA cert)
     self.output.info(f"Creating certificate chain")
-    with open(chain_file, 'w') as outfile:
-      with open(cert_file, 'r') as infile:
-        outfile.write(infile.read())
-      with open(ca_cert_file, 'r') as infile:
-        outfile.write(infile.read())
+    chain_file.write_bytes(cert_file.read_bytes() + ca_cert_file.read_bytes())
 
     self.output.success(f"Full chain certificate: [default]{chain_file}")
 
@@ -957,22 +1143,15 @@ tls:
     if result.returncode == 0:
       certinfo = result.stdout.strip()
 
-    self.output.info(f"Verifying certificate chain")
+    # Both files are checked by one openssl process, failures name the file
+    self.output.info("Verifying certificate and full chain")
     result = subprocess.run(
-      ["openssl", "verify", "-CAfile", ca_cert_file, cert_file],
+      ["openssl", "verify", "-CAfile", ca_cert_file, cert_file, chain_file],
       capture_output=True, text=True
     )
     if result.returncode != 0:
       self.output.warning(f"Verification: {result.stderr.strip()}")
 
-    self.output.info(f"Verifying full chain certificate")
-    result = subprocess.run(
-      ["openssl", "verify", "-CAfile", ca_cert_file, chain_file],
-      capture_output=True, text=True
-    )
-    if result.returncode != 0:
-      self.output.warning(f"Full chain verification: {result.stderr.strip()}")
-
     show_certs = f"""[bold cyan]Certificate Information:[/bold cyan]
 {certinfo}
 
@@ -1,68 +1,95 @@
+import re
+import sys
+from functools import cached_property
+from typing import Optional
 
-from rich.console import Console
-from rich.panel import Panel
-
-
-class SingletonMeta(type):
-  _instances = {}
-
-  def __call__(cls, *args, **kwargs):
-    if cls not in cls._instances:
-      cls._instances[cls] = super().__call__(*args, **kwargs)
-    return cls._instances[cls]
+# Rich markup tags, stripped from messages printed without Rich
+TAG_RE = re.compile(r'\[/?[a-z#@][^\[\]]*\]')
 
 ##
 # Output utilities with Rich.Console
 ##
-class Output(metaclass=SingletonMeta):
+class Output:
   """Handle formatted output using Rich."""
 
+  # Icon name -> (colored, plain) icon
+  ICONS = {
+    'info':    ("ℹ", "[i]"),
+    'status':  ("◌", "[i]"),
+    'ok':      ("✓", "[ok]"),
+    'error':   ("✗", "[x]"),
+    'warning': ("⚠", "[!]"),
+    'debug':   ("⚙", "[d]"),
+  }
+
   def __init__(self, verbose: bool = False, no_color: bool = None):
-    # Only initialize once
-    if not hasattr(self, '_initialized'):
-      self.is_verbose = verbose
-      self.colors = not no_color
-      self.console = Console(no_color=no_color)
-      self.error_console = Console(stderr=True, no_color=no_color)
-      self._initialized = True
+    self.is_verbose = verbose
+    self.colors = not no_color
+    self.no_color = no_color
+    self._icons = {name: icons[0 if self.colors else 1] for name, icons in self.ICONS.items()}
+    # Messages to a pipe or file are written as plain text, without Rich
+    self.is_tty = sys.stdout.isatty()
+    self.is_error_tty = sys.stderr.isatty()
+
+  @cached_property
+  def console(self):
+    from rich.console import Console
+    return Console(no_color=self.no_color)
+
+  @cached_property
+  def error_console(self):
+    from rich.console import Console
+    return Console(stderr=True, no_color=self.no_color)
+
+  def _print(self, markup: str, icon: str, message: str, stderr: bool = False):
+    """Print the markup with Rich on a terminal, otherwise the plain icon and message"""
+    if stderr:
+      if self.is_error_tty:
+        self.error_console.print(markup)
+      else:
+        sys.stderr.write(f"{icon} {TAG_RE.sub('', message)}\n")
+    elif self.is_tty:
+      self.console.print(markup)
+    else:
+      sys.stdout.write(f"{icon} {TAG_RE.sub('', message)}\n")
 
   def icon(self, icon: str) -> str:
     """Return a formatted icon"""
-    c = self.colors
-    match icon:
-      case "info": return "ℹ" if c else "[i]"
-      case "status": return "◌" if c else "[i]"
-      case "ok": return "✓" if c else "[ok]"
-      case "error": return "✗" if c else "[x]"
-      case "warning": return "⚠" if c else "[!]"
-      case "debug": return "⚙" if c else "[d]"
-    return ""
+    return self._icons.get(icon, "")
 
   def success(self, message: str):
-    self.console.print(f"[bold green]{self.icon('ok')} {message}[/bold green]")
+    icon = self.icon('ok')
+    self._print(f"[bold green]{icon} {message}[/bold green]", icon, message)
 
   def error(self, message: str):
-    self.error_console.print(f"[bold red]{self.icon('error')} {message}[/bold red]")
+    icon = self.icon('error')
+    self._print(f"[bold red]{icon} {message}[/bold red]", icon, message, stderr=True)
 
   def warning(self, message: str):
-    self.console.print(f"[bold yellow]{self.icon('warning')} {message}[/bold yellow]")
+    icon = self.icon('warning')
+    self._print(f"[bold yellow]{icon} {message}[/bold yellow]", icon, message)
 
   def info(self, message: str):
-    self.console.print(f"[bold blue]{self.icon('info')}[/bold blue] {message}")
+    icon = self.icon('info')
+    self._print(f"[bold blue]{icon}[/bold blue] {message}", icon, message)
 
   def debug(self, message: str):
     if self.is_verbose:
-      self.console.print(f"[dim]{self.icon('debug')} {message}[/dim]")
+      icon = self.icon('debug')
+      self._print(f"[dim]{icon} {message}[/dim]", icon, message)
 
   def verbose(self, message: str):
     if self.is_verbose:
-      self.console.print(f"[bold]{self.icon('debug')}[/bold] {message}")
+      icon = self.icon('debug')
+      self._print(f"[bold]{icon}[/bold] {message}", icon, message)
 
   def verbose_panel(self, content: str, title: str = "", border_style: str = "cyan"):
     if self.is_verbose:
+      from rich.panel import Panel
       self.console.print(Panel(content, title=title, border_style=border_style, width=80))
 
   def panel(self, content: str, title: str = "", border_style: str = "cyan"):
+    from rich.panel import Panel
     self.console.print(Panel(content, title=title, border_style=border_style))
 
   def status(self, message: str):
@@ -74,3 +101,13 @@ class Output(metaclass=SingletonMeta):
   def separator(self):
     self.console.print("[dim]" + "-" * 40 + "[/dim]")
 
+
+_output: Optional[Output] = None
+
+
+def get_output(verbose: bool = False, no_color: bool = None) -> Output:
+  """Return the shared Output, created with the flags of the first call"""
+  global _output
+  if _output is None:
+    _output = Output(verbose, no_color)
+  return _output
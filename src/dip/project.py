@@ -1,12 +1,17 @@
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Optional, Dict
 
-from dip.config import config
-from dip.output import Output
+from dip.config import (
+  config, ENV_PROJECT_NAME, ENV_PROJECT_ROOT, ENV_FILE, ENV_DIP_DIR,
+  ENV_CONTAINER_ROOT, ENV_HOST_UID, ENV_HOST_GID, ENV_COMPOSE_NAME,
+)
+from dip.output import get_output
 
 DIR_NAME = f".{config.bin_name}"
+ROOT_ENV_NAME = "DIP_ROOT" # Project root override, skips the directory lookup
 
 ##
 # Project configuration helper class
@@ -15,7 +20,7 @@ class ProjectConfig:
   """Handle project-specific configuration"""
 
   def __init__(self, root: Path):
-    self.output = Output()
+    self.output = get_output()
     self.root_dir: Path = root
     self.dip_dir: Path = root / DIR_NAME
     self.env_file: Path = self.dip_dir / ".env"
@@ -28,65 +33,89 @@ class ProjectConfig:
     if not self.env_file.exists():
       raise FileNotFoundError(f"Env file not found: {self.env_file}")
 
-    with open(self.env_file) as f:
-      for line in f:
-        line = line.strip()
-        if line and not line.startswith('#') and '=' in line:
-          key, value = line.split('=', 1)
-          self.env_name[key.strip()] = value.strip()
+    self.env_name = self._load_env()
 
-    self.project_name = self.env_name.get(config.env_name['project_name'])
+    self.project_name = self.env_name.get(ENV_PROJECT_NAME)
     if not self.project_name:
       raise ValueError(
-        f"Env '{config.env_name['project_name']}' must be set in {self.env_file}"
+        f"Env '{ENV_PROJECT_NAME}' must be set in {self.env_file}"
       )
 
-    container_dir = self.env_name.get(config.env_name['container_root'])
+    container_dir = self.env_name.get(ENV_CONTAINER_ROOT)
     if container_dir:
       self.container_dir = container_dir
     else:
       self.output.warning(
-        f"Env '{config.env_name['container_root']}' is not set, using default path: {self.container_dir}"
+        f"Env '{ENV_CONTAINER_ROOT}' is not set, using default path: {self.container_dir}"
       )
 
     icon = f"[bold green]{self.output.icon('ok')}[/bold green]"
     self.output.verbose_panel(
-      content=f"{icon} {config.env_name['project_root']}: {self.root_dir}\n"
-              f"{icon} {config.env_name['container_root']}: {self.container_dir}\n"
-              f"{icon} {config.env_name['dip_dir']}: {self.dip_dir}\n"
-              f"{icon} {config.env_name['env_file']}: {self.env_file}\n",
+      content=f"{icon} {ENV_PROJECT_ROOT}: {self.root_dir}\n"
+              f"{icon} {ENV_CONTAINER_ROOT}: {self.container_dir}\n"
+              f"{icon} {ENV_DIP_DIR}: {self.dip_dir}\n"
+              f"{icon} {ENV_FILE}: {self.env_file}\n",
       title="[bold green]Project Config[/bold green]",
     )
 
-  def get_env(self) -> Dict[str, str]:
-    """Get environment variables for docker-compose"""
-    env = os.environ.copy()
-    env.update(self.env_name)
-
-    env_name = config.env_name
-    env.update({
-      env_name['project_root']:   str(self.root_dir),
-      env_name['project_name']:   str(self.project_name),
-      env_name['compose_name']:   str(self.project_name),
-      env_name['container_root']: str(self.container_dir),
-      env_name['dip_dir']:        str(self.dip_dir),
-      env_name['env_file']:       str(self.env_file),
-      env_name['host_uid']:       str(os.getuid()),
-      env_name['host_gid']:       str(os.getgid()),
-    })
+  def _load_env(self) -> Dict[str, str]:
+    """Parse `KEY=VALUE` lines of the env file, skipping comments"""
+    env = {}
+    # Single read of the whole (small) file, no per-line buffered reads
+    for line in self.env_file.read_text().splitlines():
+      # One partition per line instead of separate strip/startswith/in/split scans
+      key, sep, value = line.partition('=')
+      key = key.strip()
+      if sep and key and key[0] != '#':
+        env[key] = value.strip()
     return env
 
+  @cached_property
+  def compose_name(self) -> str:
+    """Project name as compose normalises it for its labels"""
+    # Lowercased, only [a-z0-9_-] kept, no leading '_' or '-'
+    name = self.project_name.lower()
+    allowed = "abcdefghijklmnopqrstuvwxyz0123456789_-"
+    return ''.join(char for char in name if char in allowed).lstrip('_-')
+
+  def get_env(self) -> Dict[str, str]:
+    """Get environment variables for docker-compose (shared dict, do not modify)"""
+    return self._env
+
+  @cached_property
+  def _env(self) -> Dict[str, str]:
+    """Merged once, every compose call reuses the same environment"""
+    return {
+      **os.environ,
+      **self.env_name,
+      ENV_PROJECT_ROOT:   str(self.root_dir),
+      ENV_PROJECT_NAME:   str(self.project_name),
+      ENV_COMPOSE_NAME:   str(self.project_name),
+      ENV_CONTAINER_ROOT: str(self.container_dir),
+      ENV_DIP_DIR:        str(self.dip_dir),
+      ENV_FILE:           str(self.env_file),
+      ENV_HOST_UID:       str(os.getuid()),
+      ENV_HOST_GID:       str(os.getgid()),
+    }
+
+
+@lru_cache(maxsize=1)
+def find_root(cwd: str) -> Optional[Path]:
+  """Find the project root by looking for the .dip directory from `cwd` up"""
+  # Plain string paths, one stat per level and no Path objects until found
+  current = cwd
+  while (parent := os.path.dirname(current)) != current:
+    if os.path.isdir(os.path.join(current, DIR_NAME)):
+      return Path(current)
+    current = parent
+  return None
+
 
 def load_project() -> Optional[ProjectConfig]:
-  """Find the project root by looking for the .dip directory"""
-  def find_root() -> Optional[Path]:
-    current = Path.cwd()
-    while current != current.parent:
-      if (current / DIR_NAME).is_dir():
-        return current
-      current = current.parent
-    return None
-
-  root = find_root()
-  return ProjectConfig(root) if root else None
+  """Load the project of the current directory, or of $DIP_ROOT when set"""
+  root = os.environ.get(ROOT_ENV_NAME)
+  if root and (Path(root) / DIR_NAME).is_dir():
+    return ProjectConfig(Path(root))
 
+  root = find_root(os.getcwd())
+  return ProjectConfig(root) if root else None